@@ -184,6 +184,7 @@ class BaseTask(base_mixins.BaseMixin):
             sleep=0,
             log_level='info'
         )
+        prism.prism_logging.flush_console_events()
         return event_list
 
     def run(self):
@@ -221,9 +221,8 @@ class RunTask(prism.cli.compile.CompileTask, prism.mixins.run.RunMixin):
             executor_events = executor_output.event_list
             event_list.extend(executor_events)
 
-            # If success = 0, then there was an error in the DagExecutor
-            # multiprocessing. This return structure is confusing; we should eventually
-            # fix this.
+            # If success = 0, then there was an error in one of the DagExecutor's
+            # tasks. This return structure is confusing; we should eventually fix this.
             if success == 0:
                 event_list = self.fire_error_events(
                     event_list,
@@ -57,6 +57,12 @@ INTERNAL_HOOKS_VARNAME = '__PRISM_HOOKS__'
 # Python version
 PYTHON_VERSION = sys.version_info
 
+# Whether the interpreter is a free-threaded build running without the GIL.
+# `sys._is_gil_enabled` exists on Python 3.13+; it returns False only on a
+# free-threaded build running with the GIL disabled. Older versions always have the
+# GIL.
+GIL_DISABLED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
 # Trigger types
 VALID_TRIGGER_TYPES = ["function"]
 
@@ -29,6 +29,8 @@ from prism.ui import RED, GREEN, EVENT_COLOR, RESET
 
 @dataclass
 class EventManagerOutput:
+    # One of these is created for every task attempt, so avoid a per-instance __dict__
+    __slots__ = ('outputs', 'event_to_fire', 'event_list')
     outputs: Any
     event_to_fire: Optional[prism.prism_logging.Event]
     event_list: List[prism.prism_logging.Event]
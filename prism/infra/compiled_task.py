@@ -13,8 +13,9 @@ Table of Contents
 # Standard library imports
 import ast
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 import re
+import types
 
 # Prism-specific imports
 import prism.exceptions
@@ -43,19 +44,33 @@ class CompiledTask:
         self.task_name = task_name
         self.task_relative_path = task_relative_path
         self.task_full_path = task_full_path
-        with open(self.task_full_path, 'r') as f:
-            self.task_str = f.read()
-        f.close()
 
-        # # Task as an AST
+        # Value of `__file__` when the task is executed
+        self.task_full_path_str = str(self.task_full_path)
+
+        # Task as an AST. The parser has already read the task, so reuse its source
+        # rather than reading the file again.
         self.ast_parser = task_ast_parser
+        self.task_str = self.ast_parser.task_str
+
+        # Code object for the task, compiled the first time the task is instantiated
+        self._code: Optional[types.CodeType] = None
 
         # Task name
         self.name = re.sub(r'\.py$', '', str(self.task_relative_path))
 
         # Set manifest
         self.task_manifest = task_manifest
-        self.refs = self.task_manifest.manifest_dict["refs"][self.name][self.task_name]  # noqa: E501
+        refs = self.task_manifest.manifest_dict["refs"][self.name][self.task_name]
+
+        # Normalize refs to a list once, so that consumers don't have to
+        if isinstance(refs, str):
+            refs = [refs]
+        if not isinstance(refs, list):
+            raise prism.exceptions.CompileException(
+                message=f'invalid type `{type(refs)}`, must be list'
+            )
+        self.refs: List[str] = refs
 
         # Task var name
         self.task_var_name = f"{self.name}.{self.task_name}"
@@ -124,12 +139,29 @@ class CompiledTask:
             retry_delay_seconds = 0
         return retries, retry_delay_seconds
 
+    def get_code(self) -> types.CodeType:
+        """
+        Compile the task into a code object. The task's AST parser has already parsed
+        the task, so we compile its AST rather than re-parsing the source. The code
+        object is cached, so the task is only compiled once no matter how many times it
+        is executed. We compile lazily so that any errors are raised while the task is
+        being run (and can therefore be handled by the event manager).
+
+        returns:
+            code object for the task
+        """
+        if self._code is None:
+            # Use the same filename as `exec(<str>)` so that error messages are
+            # unchanged.
+            self._code = compile(self.ast_parser.ast_module, '<string>', 'exec')
+        return self._code
+
     def instantiate_task_class(self,
         run_context: Dict[Any, Any],
         task_manager: PrismTaskManager,
         hooks: PrismHooks,
         explicit_run: bool = True,
-        user_context: Dict[Any, Any] = {}
+        user_context: Optional[Dict[Any, Any]] = None
     ):
         """
         Instantiate PrismTask child from task
@@ -154,7 +186,7 @@ class CompiledTask:
             )
 
         # Execute class definition and create task
-        exec(self.task_str, run_context)
+        exec(self.get_code(), run_context)
 
         # If the user specified a task, great!
         if isinstance(prism_task_node, ast.ClassDef):
@@ -188,7 +220,7 @@ class CompiledTask:
         task_manager: PrismTaskManager,
         hooks: PrismHooks,
         explicit_run: bool = True,
-        user_context: Dict[Any, Any] = {}
+        user_context: Optional[Dict[Any, Any]] = None
     ) -> PrismTaskManager:
         """
         Execute task
@@ -14,7 +14,7 @@ Table of Contents
 import os
 import networkx as nx
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 # Prism-specific imports
 import prism.constants
@@ -49,23 +49,32 @@ class CompiledDag:
         self.task_manifests = task_manifests
         self.parsed_tasks = parsed_tasks
 
+        # Position of each task in the topological sort, and the set of tasks in the
+        # topological sort. These are computed once and shared with any executor.
+        self.topo_index: Dict[str, int] = {
+            name: i for i, name in enumerate(self.topological_sort)
+        }
+        self.topo_set: FrozenSet[str] = frozenset(self.topological_sort)
+
         # Store full paths in attribute
         self.topological_sort_full_path = []
 
+        # Parsers for each task module, so that we don't have to scan the list of
+        # parsers for every task.
+        parsers_by_path = {_p.task_relative_path: _p for _p in self.parsed_tasks}
+
         # Create task objects
         self.compiled_tasks = []
         for _task in self.topological_sort:
             # Task name
-            task_name = _task.split('.')[1]
+            module_name, task_name = _task.split('.')[:2]
 
             # Relative path and full path
-            relative_path = Path(f'{_task.split(".")[0]}.py')
+            relative_path = Path(f'{module_name}.py')
             full_path = tasks_dir / relative_path
 
             # Current parser
-            task_ast_parser = [
-                _p for _p in self.parsed_tasks if _p.task_relative_path == relative_path  # noqa: E501
-            ][0]
+            task_ast_parser = parsers_by_path[relative_path]
 
             # Update attribute
             self.topological_sort_full_path.append(full_path)
@@ -414,6 +423,7 @@ class DagCompiler:
             prism_project_py_str = prism_project.prism_project_py_str
         manifest.add_prism_project(prism_project_py_str)
         manifest.json_dump(self.compiled_dir)
+        self.manifest = manifest
 
         # Return dag
         dag = CompiledDag(
@@ -11,15 +11,18 @@ Table of Contents
 ###########
 
 # Standard library imports
+import ast
+import collections
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from multiprocessing.dummy import Pool
+import functools
 from pathlib import Path
+import queue
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
-import re
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
 
 # Prism-specific imports
-import prism.exceptions
 from prism.infra import compiled_task
 from prism.infra import compiler as prism_compiler
 from prism.infra.task_manager import PrismTaskManager
@@ -27,7 +30,12 @@ from prism.infra.hooks import PrismHooks
 import prism.prism_logging
 from prism.prism_logging import Event, fire_console_event
 from prism.event_managers import base as base_event_manager
-from prism.constants import INTERNAL_TASK_MANAGER_VARNAME, INTERNAL_HOOKS_VARNAME
+from prism.constants import (
+    GIL_DISABLED,
+    INTERNAL_TASK_MANAGER_VARNAME,
+    INTERNAL_HOOKS_VARNAME,
+)
+from prism.parsers.ast_parser import prism_hooks_alias
 
 
 ####################
@@ -41,11 +49,24 @@ class ExecutorOutput:
     EventManager. We only need this because we need the error event and event list to
     cascade up to the PrismPipeline class.
     """
+    __slots__ = ('success', 'error_event', 'event_list')
     success: int
     error_event: Optional[Event]
     event_list: List[Event]
 
 
+@dataclass
+class TaskAttemptOutput:
+    """
+    Class for defining the output of a single attempt at executing a task.
+    `retry_delay_seconds` is the delay before the next attempt, or None if the task
+    should not be retried.
+    """
+    __slots__ = ('result', 'retry_delay_seconds')
+    result: base_event_manager.EventManagerOutput
+    retry_delay_seconds: Optional[int]
+
+
 class DagExecutor:
     """
     Class for introducing concurrency in DAG execution
@@ -57,32 +78,64 @@ class DagExecutor:
         user_arg_all_upstream: bool,
         user_arg_all_downstream: bool,
         threads: int,
-        user_context: Dict[Any, Any] = {}
+        user_context: Optional[Dict[Any, Any]] = None
     ):
         self.project_dir = project_dir
         self.compiled_dag = compiled_dag
 
         # Extract attributes from compiled_dag instance
-        self.compiled_tasks = self.compiled_dag.compiled_tasks
+        self.compiled_tasks: Deque[compiled_task.CompiledTask] = collections.deque(
+            self.compiled_dag.compiled_tasks
+        )
         self.nxdag = self.compiled_dag.nxdag
         self.topological_sort_task_names = self.compiled_dag.topological_sort
         self.topological_sort_full_path = self.compiled_dag.topological_sort_full_path
         self.user_arg_tasks = self.compiled_dag.user_arg_tasks
         self.user_arg_all_upstream = user_arg_all_upstream
         self.user_arg_all_downstream = user_arg_all_downstream
-        self.user_context = user_context
+        self.user_context = {} if user_context is None else user_context
 
         # Identify nodes not explicitly run and update (only if --all-upstream is False)
+        self._user_arg_tasks_set = frozenset(self.user_arg_tasks)
         if not self.user_arg_all_upstream and not self.user_arg_all_downstream:
-            self.nodes_not_explicitly_run = list(
-                set(self.topological_sort_task_names) - set(self.user_arg_tasks)
+            self.nodes_not_explicitly_run = (
+                self.compiled_dag.topo_set - self._user_arg_tasks_set
             )
         else:
-            self.nodes_not_explicitly_run = []
+            self.nodes_not_explicitly_run = frozenset()
+
+        # Position of each task in the topological sort, and the user arg tasks sorted
+        # in the order in which they appear in the DAG. These are used to compute the
+        # idx and total of each task's execution events.
+        self._topo_index = self.compiled_dag.topo_index
+        self._tasks_sorted = sorted(
+            self.user_arg_tasks, key=self._topo_index.__getitem__
+        )
+        self._tasks_sorted_index: Dict[str, int] = {
+            name: i for i, name in enumerate(self._tasks_sorted)
+        }
+
+        # Event managers for each task, reused across retries
+        self._event_managers: Dict[str, base_event_manager.BaseEventManager] = {}
 
         # Number of processes used to run concurrent tasks
         self.threads = threads
 
+        # Upstream / downstream dependencies for each task. Only tasks that are part of
+        # the compiled DAG are considered; the full DAG may contain nodes that are not
+        # being run.
+        task_names = set(_t.task_var_name for _t in self.compiled_tasks)
+        self._refs_by_name: Dict[str, Tuple[str, ...]] = {
+            name: tuple(
+                _p for _p in self.nxdag.predecessors(name) if _p in task_names
+            ) for name in task_names
+        }
+        self._dependents: Dict[str, Tuple[str, ...]] = {
+            name: tuple(
+                _s for _s in self.nxdag.successors(name) if _s in task_names
+            ) for name in task_names
+        }
+
     def set_run_context(self, run_context: Dict[Any, Any]):
         """
         Set executor globals; needs to be called before `exec`
@@ -94,161 +147,268 @@ class DagExecutor:
 
     def check_task_refs(self, task: compiled_task.CompiledTask) -> List[str]:
         """
-        Get task refs
+        Get task refs. The executor itself uses the refs in the DAG (see
+        `_refs_by_name`); this is kept for backwards compatibility.
 
         args:
             task: CompiledTask object
         returns:
             refs as a list of strings
         """
-        if isinstance(task.refs, str):
-            return [task.refs]
+        return task.refs
+
+    def _get_event_manager(self,
+        task: compiled_task.CompiledTask,
+        full_tb: bool
+    ) -> base_event_manager.BaseEventManager:
+        """
+        Get the event manager for a task. The event manager is created on the task's
+        first attempt and reused for its retries; only its name changes between
+        attempts.
+
+        args:
+            task: CompiledTask object
+            full_tb: boolean indicating whether to show the full traceback
+        returns:
+            BaseEventManager for the task
+        """
+        task_name = task.task_var_name
+        script_manager = self._event_managers.get(task_name)
+        if script_manager is not None:
+            return script_manager
+
+        # If all upstream tasks are to be run, the compute the idx and total using the
+        # `dag`` list. Otherwise, if the script is explicitly included in the user's run
+        # command then compute the idx and total using the `tasks` list. Otherwise,
+        # set both to None.
+        if self.user_arg_all_upstream or self.user_arg_all_downstream:
+            idx = self._topo_index[task_name] + 1
+            total = len(self.topological_sort_task_names)
+        elif task_name in self._user_arg_tasks_set:
+            idx = self._tasks_sorted_index[task_name] + 1
+            total = len(self._tasks_sorted)
         else:
-            if not isinstance(task.refs, list):
-                raise prism.exceptions.CompileException(
-                    message=f'invalid type `{type(task.refs)}`, must be list'
-                )
-            return task.refs
+            idx = None
+            total = None
+        script_manager = base_event_manager.BaseEventManager(
+            idx=idx,
+            total=total,
+            name=task_name,
+            full_tb=full_tb,
+            func=task.exec
+        )
+        self._event_managers[task_name] = script_manager
+        return script_manager
 
     def exec_single(self,
         full_tb: bool,
         task: compiled_task.CompiledTask,
         task_manager: Union[int, PrismTaskManager],
         hooks: PrismHooks,
-        user_context: Dict[Any, Any] = {}
+        user_context: Optional[Dict[Any, Any]] = None
     ) -> base_event_manager.EventManagerOutput:
         """
-        Callback used to get results of task execution in Pool
+        Execute task with the appropriate number of retries, sleeping between attempts
         """
-        # Keep track of current module in tasks manager
-        if isinstance(task_manager, PrismTaskManager):
-            task_manager.curr_module = re.sub(
-                r'\.py$', '', str(task.task_relative_path)
+        if user_context is None:
+            user_context = {}
+        num_runs = 1
+        base_name = task.task_var_name
+        name = base_name
+
+        # For testing, keep track of all events
+        all_events: List[Event] = []
+
+        while True:
+            attempt_output = self.exec_attempt(
+                full_tb,
+                task,
+                task_manager,
+                hooks,
+                user_context,
+                name,
+                num_runs
             )
+            script_event_manager_result = attempt_output.result
+            all_events.extend(script_event_manager_result.event_list)
 
-        # Keep track of events
+            # Retry, if needed
+            if attempt_output.retry_delay_seconds is None:
+                break
+            time.sleep(attempt_output.retry_delay_seconds)
+            num_runs += 1
+            name = f'{base_name} (RETRY {num_runs - 1})'
+
+        # Now, update the event list of the output
+        script_event_manager_result.event_list = all_events
+        return script_event_manager_result
+
+    def exec_attempt(self,
+        full_tb: bool,
+        task: compiled_task.CompiledTask,
+        task_manager: Union[int, PrismTaskManager],
+        hooks: PrismHooks,
+        user_context: Dict[Any, Any],
+        name: str,
+        num_runs: int
+    ) -> TaskAttemptOutput:
+        """
+        Execute a single attempt of a task. If the attempt fails and the task has
+        retries remaining, then the output contains the number of seconds to wait before
+        the next attempt; the caller is responsible for scheduling that attempt.
+
+        args:
+            full_tb: boolean indicating whether to show the full traceback
+            task: CompiledTask object
+            task_manager: PrismTaskManager object
+            hooks: PrismHooks object
+            user_context: user context
+            name: name to use for the task's events
+            num_runs: attempt number, starting at 1
+        returns:
+            TaskAttemptOutput
+        """
+        # Keep track of events. If an upstream task failed, then there's nothing to do.
         event_list: List[Event] = []
         if task_manager == 0:
-            return base_event_manager.EventManagerOutput(0, None, event_list)
+            return TaskAttemptOutput(
+                base_event_manager.EventManagerOutput(0, None, event_list), None
+            )
+
+        # Keep track of current module in tasks manager. The task's `name` is its
+        # relative path without the `.py` suffix.
+        if isinstance(task_manager, PrismTaskManager):
+            task_manager.curr_module = task.name
         task_name = task.task_var_name
-        relative_path = task.task_relative_path
 
         # Boolean for whether to fire exec event for current script. We do not want to
         # fire the exec events if the user did not explicitly include the script in
         # their arguments
-        fire_exec_events = task_name in self.user_arg_tasks \
+        fire_exec_events = task_name in self._user_arg_tasks_set \
             or self.user_arg_all_upstream \
             or self.user_arg_all_downstream
 
-        # If all upstream tasks are to be run, the compute the idx and total using the
-        # `dag`` list. Otherwise, if the script is explicitly included in the user's run
-        # command then compute the idx and total using the `tasks` list. Otherwise,
-        # set both to None.
-
-        # First, sort the user arg tasks in the order in which they appear in the DAG
-        tasks_idx = [
-            self.topological_sort_task_names.index(m) for m in self.user_arg_tasks
-        ]
-        tasks_sorted = [x for _, x in sorted(zip(tasks_idx, self.user_arg_tasks))]
-
-        # Define the idx and total
-        if self.user_arg_all_upstream or self.user_arg_all_downstream:
-            idx = self.topological_sort_task_names.index(task_name) + 1
-            total = len(self.topological_sort_task_names)
-        elif task_name in self.user_arg_tasks:
-            idx = tasks_sorted.index(task_name) + 1
-            total = len(tasks_sorted)
-        else:
-            idx = None
-            total = None
-
         # Event manager. We want '__file__' to be the path to the un-compiled task.
         # Instances of DagExecutor will only be called within the project directory.
-        # Therefore, __files__ should be tasks/{name of script}
-        self.run_context['__file__'] = str(
-            Path(self.compiled_dag.tasks_dir) / str(relative_path)
-        )
-
-        # Execute the task with appropriate number of retries
+        # Therefore, __files__ should be tasks/{name of script}. Tasks may run
+        # concurrently, so each attempt gets its own copy of the run context rather
+        # than setting '__file__' on the shared one. Shared objects (e.g., the task
+        # manager and hooks) are still shared between copies.
+        local_run_context = {
+            **self.run_context,
+            '__file__': task.task_full_path_str,
+        }
+
+        # Only fire empty line if last retry has been executed
         retries, retry_delay_seconds = task.grab_retries_metadata()
-        num_runs = 0
         num_expected_runs = retries + 1
-        outputs = 0
-        name = task.task_var_name
-
-        # For testing, keep track of all events
-        all_events = []
-
-        while num_runs != num_expected_runs and outputs == 0:
-            # Keep track of script events
-            script_event_list: List[Event] = []
+        fire_empty_line_events = num_runs == num_expected_runs
+        script_manager = self._get_event_manager(task, full_tb)
+        script_manager.name = name
+        script_event_manager_result: base_event_manager.EventManagerOutput = script_manager.manage_events_during_run(  # noqa: E501
+            event_list,
+            fire_exec_events,
+            fire_empty_line_events,
+            run_context=local_run_context,
+            task_manager=task_manager,
+            hooks=hooks,
+            explicit_run=task.task_var_name not in self.nodes_not_explicitly_run,
+            user_context=user_context
+        )
 
-            num_runs += 1
-            if num_runs > 1:
-                script_event_list = fire_console_event(
-                    prism.prism_logging.DelayEvent(
-                        name, retry_delay_seconds
-                    ),
-                    script_event_list,
-                    log_level='warn'
-                )
-                time.sleep(retry_delay_seconds)
-                name = name + f' (RETRY {num_runs - 1})'
-
-            # Only fire empty line if last retry has been executed
-            fire_empty_line_events = num_runs == num_expected_runs
-            script_manager = base_event_manager.BaseEventManager(
-                idx=idx,
-                total=total,
-                name=name,
-                full_tb=full_tb,
-                func=task.exec
-            )
-            script_event_manager_result: base_event_manager.EventManagerOutput = script_manager.manage_events_during_run(  # noqa: E501
-                script_event_list,
-                fire_exec_events,
-                fire_empty_line_events,
-                run_context=self.run_context,
-                task_manager=task_manager,
-                hooks=hooks,
-                explicit_run=task.task_var_name not in self.nodes_not_explicitly_run,
-                user_context=user_context
+        # Callers access task instances via the shared run context, so publish the
+        # instance created by this attempt.
+        if task_name in local_run_context:
+            self.run_context[task_name] = local_run_context[task_name]
+
+        # If the attempt failed and there are retries remaining, then let the user know
+        # that the task will be restarted.
+        if script_event_manager_result.outputs == 0 and num_runs < num_expected_runs:
+            script_event_manager_result.event_list = fire_console_event(
+                prism.prism_logging.DelayEvent(
+                    name, retry_delay_seconds
+                ),
+                script_event_manager_result.event_list,
+                log_level='warn'
             )
+            return TaskAttemptOutput(script_event_manager_result, retry_delay_seconds)
+        return TaskAttemptOutput(script_event_manager_result, None)
 
-            # All events
-            all_events += script_event_manager_result.event_list
-
-            # Set output
-            outputs = script_event_manager_result.outputs
+    def _cancel_connections(self,
+        executor: ThreadPoolExecutor,
+        futures: Dict[str, 'Future[TaskAttemptOutput]'],
+        timers: List[threading.Timer]
+    ):
+        """
+        Given an executor, cancel all tasks that have not started (including scheduled
+        retries) and wait until all running tasks gently terminate.
+        """
+        for timer in timers:
+            timer.cancel()
+        for future in futures.values():
+            future.cancel()
+        executor.shutdown(wait=True)
 
-        # Now, update the event list of the output
-        script_event_manager_result.event_list = all_events
-        return script_event_manager_result
+    def _tasks_release_gil(self) -> bool:
+        """
+        Check whether any task uses a hook that releases the GIL (see
+        `PrismHooks.hooks_releasing_gil`). If not, then running the tasks in multiple
+        threads may not speed up the DAG. Tasks can still release the GIL without
+        hooks, e.g., by sleeping or calling into other libraries, so this is only a
+        hint.
 
-    def _cancel_connections(self, pool):
+        returns:
+            True if at least one task uses a hook that releases the GIL
         """
-        Given a pool, cancel all adapter connections and wait until all
-        runners gentle terminates.
+        hooks_releasing_gil = self.run_context[
+            INTERNAL_HOOKS_VARNAME
+        ].hooks_releasing_gil
+        for task in self.compiled_tasks:
+            for node in ast.walk(task.ast_parser.ast_module):
+                if (
+                    isinstance(node, ast.Attribute)
+                    and isinstance(node.value, ast.Name)  # noqa: W503
+                    and node.value.id == prism_hooks_alias  # noqa: W503
+                    and node.attr in hooks_releasing_gil  # noqa: W503
+                ):
+                    return True
+        return False
+
+    def _drain_event_chunks(self) -> List[Event]:
         """
-        pool.close()
-        pool.terminate()
-        pool.join()
+        Concatenate the event lists produced by each task into a single list. Tasks put
+        their event lists into a queue as they finish so that the completion callbacks
+        don't repeatedly resize a shared list.
+
+        returns:
+            list of events, in the order in which tasks finished
+        """
+        event_list: List[Event] = []
+        while True:
+            try:
+                event_list.extend(self._event_chunks.get_nowait())
+            except queue.Empty:
+                break
+        self.event_list = event_list
+        return event_list
 
     def exec(self, full_tb: bool):
         """
         Execute DAG. Our general approach is as follows:
-            1. Create a queue of the tasks (i.e., the tasks) that need to be executed.
-            2. Create a pool with `n` processes
-            3. While queue is not empty
-                - Get task from the top of the queue
-                - If task doesn't have any refs, add it to the pool
-                - If task does have refs, then wait for those refs to finish before
-                  adding it to pool
-                - Once task has been added to queue, remove it from queue
+            1. Compute the number of unfinished upstream tasks for each task
+            2. Create an executor with `n` threads
+            3. Submit all tasks that do not have any refs to the executor
+            4. Whenever a task finishes, remove it from the unfinished refs of its
+               downstream tasks, and submit any downstream task that no longer has
+               unfinished refs
+            5. If an attempt fails and the task has retries remaining, resubmit the
+               task once the retry delay has elapsed
+            6. Stop once all tasks have finished or an error has occurred
         """
 
         # Keep track of events
-        self.event_list: List[Event] = []
+        self.event_list = []
+        self._event_chunks: 'queue.SimpleQueue[List[Event]]' = queue.SimpleQueue()
 
         def callback(result: base_event_manager.EventManagerOutput):
             task_manager = result.outputs
@@ -256,12 +416,12 @@ class DagExecutor:
             runner_event_list = result.event_list
 
             # If task_manager==0, then we want to raise an error. However, if we do so
-            # here, it'll get swallowed by the pool.
+            # here, it'll get swallowed by the executor.
             if task_manager == 0:
                 self._wait_and_return = True
                 self.error_event = error_event
             self.task_manager = task_manager
-            self.event_list += runner_event_list
+            self._event_chunks.put(runner_event_list)
             return
 
         # Execute all statements, stopping at first error
@@ -269,82 +429,195 @@ class DagExecutor:
         self.hooks = self.run_context[INTERNAL_HOOKS_VARNAME]
         self._wait_and_return = False
         self.error_event = None
+        self._event_managers.clear()
+
+        # Bind attributes that are read for every task to local variables
+        hooks = self.hooks
+        user_context = self.user_context
 
         # If single-threaded, just run the tasks in order
         if self.threads == 1:
-            while self.compiled_tasks != []:
-                curr: compiled_task.CompiledTask = self.compiled_tasks.pop(0)
-                result = self.exec_single(
+            exec_single = self.exec_single
+            task_manager = self.task_manager
+            for curr in self.compiled_tasks:
+                result = exec_single(
                     full_tb,
                     curr,
-                    self.task_manager,
-                    self.hooks,
-                    self.user_context
+                    task_manager,
+                    hooks,
+                    user_context
                 )
                 callback(result)
-                if self.task_manager == 0:
-                    return ExecutorOutput(0, self.error_event, self.event_list)
+                task_manager = self.task_manager
+                if task_manager == 0:
+                    break
+            self.compiled_tasks.clear()
+            if self.task_manager == 0:
+                return ExecutorOutput(0, self.error_event, self._drain_event_chunks())
 
             # We need the error event and event list to cascade up to the PrismPipeline
             # class.
-            return ExecutorOutput(1, self.error_event, self.event_list)
+            return ExecutorOutput(1, self.error_event, self._drain_event_chunks())
 
-        # If the pool has multiple threads, then iterate through tasks and add them to
-        # the Pool
+        # If the executor has multiple threads, then submit tasks as soon as all of
+        # their refs have finished executing.
         else:
-            async_results = {}
-            with Pool(processes=self.threads) as pool:
-                while self.compiled_tasks != []:
+            # Let the user know if multiple threads may not help. Tasks can release
+            # the GIL without using any hooks, so only log this at the debug level and
+            # keep it out of the returned events.
+            if not GIL_DISABLED and not self._tasks_release_gil():
+                fire_console_event(
+                    prism.prism_logging.ThreadsGilHintEvent(self.threads),
+                    [],
+                    0,
+                    log_level='debug'
+                )
 
-                    # Get first task to execute
-                    curr = self.compiled_tasks[0]
-                    refs = self.check_task_refs(curr)
+            tasks_by_name = {_t.task_var_name: _t for _t in self.compiled_tasks}
+            pending_refs = {
+                name: set(refs) for name, refs in self._refs_by_name.items()
+            }
+            futures: Dict[str, 'Future[TaskAttemptOutput]'] = {}
+            timers: List[threading.Timer] = []
+
+            # Tasks are submitted from the completion callbacks (i.e., from the worker
+            # threads), so guard the shared state with a lock. The lock is re-entrant
+            # because a future that has already finished runs its callback in the
+            # thread that attached it.
+            lock = threading.RLock()
+            done = threading.Event()
+            self._inflight = 0
+            self._exec_exception: Optional[BaseException] = None
+
+            exec_attempt = self.exec_attempt
+
+            def submit(
+                executor: ThreadPoolExecutor,
+                name: str,
+                display_name: str,
+                num_runs: int
+            ):
+                future = executor.submit(
+                    exec_attempt,
+                    full_tb,
+                    tasks_by_name[name],
+                    self.task_manager,
+                    hooks,
+                    user_context,
+                    display_name,
+                    num_runs
+                )
+                futures[name] = future
+                future.add_done_callback(
+                    functools.partial(done_callback, executor, name, num_runs)
+                )
 
-                    # If an error occurred, skip all remaining tasks
+            def retry(
+                executor: ThreadPoolExecutor,
+                name: str,
+                display_name: str,
+                num_runs: int
+            ):
+                with lock:
                     if self._wait_and_return:
-                        break  # type: ignore
-
+                        self._inflight -= 1
                     else:
-
-                        # If no refs, then add task to pool
-                        if len(refs) == 0:
-                            res = pool.apply_async(
-                                self.exec_single,
-                                args=(full_tb, curr, self.task_manager, self.hooks, self.user_context),  # noqa: E501
-                                callback=callback
-                            )
-                            async_results[curr.task_var_name] = res
-                            self.compiled_tasks.pop(0)
-
-                        # Since DAG is run in order, refs should have been added to pool
-                        # before current task. Wait for upstream tasks
+                        submit(executor, name, display_name, num_runs)
+
+            def done_callback(
+                executor: ThreadPoolExecutor,
+                name: str,
+                num_runs: int,
+                future: 'Future[TaskAttemptOutput]'
+            ):
+                with lock:
+                    retry_delay_seconds = None
+                    if not future.cancelled():
+                        exception = future.exception()
+                        if exception is not None:
+                            self._wait_and_return = True
+                            self._exec_exception = exception
                         else:
-                            for ref in refs:
-                                async_results[ref].wait()
-
-                            # If an error occurred, skip all remaining tasks
-                            if self._wait_and_return:
-                                break  # type: ignore
+                            attempt_output = future.result()
+                            retry_delay_seconds = attempt_output.retry_delay_seconds
+                            if retry_delay_seconds is None:
+                                callback(attempt_output.result)
                             else:
-                                res = pool.apply_async(
-                                    self.exec_single,
-                                    args=(full_tb, curr, self.task_manager, self.hooks, self.user_context),  # noqa: E501
-                                    callback=callback
+                                self._event_chunks.put(
+                                    attempt_output.result.event_list
                                 )
-                                async_results[curr.task_var_name] = res
-                                self.compiled_tasks.pop(0)
-                pool.close()
-                pool.join()
 
-            # If error was found, then terminate pool
+                    # If the attempt failed and the task has retries remaining, then
+                    # schedule the next attempt on a timer so that the delay doesn't
+                    # tie up a thread in the executor. The task stays in flight until
+                    # its last attempt finishes.
+                    if retry_delay_seconds is not None and not self._wait_and_return:
+                        timer = threading.Timer(
+                            retry_delay_seconds,
+                            retry,
+                            args=(
+                                executor,
+                                name,
+                                f'{name} (RETRY {num_runs})',
+                                num_runs + 1
+                            )
+                        )
+                        timer.daemon = True
+                        timers.append(timer)
+                        timer.start()
+                        return
+
+                    # If an error occurred, don't submit any other tasks
+                    self._inflight -= 1
+                    if not self._wait_and_return:
+                        for dependent in self._dependents[name]:
+                            pending_refs[dependent].discard(name)
+                            if len(pending_refs[dependent]) == 0:
+                                self._inflight += 1
+                                submit(executor, dependent, dependent, 1)
+
+                    if self._inflight == 0 or self._wait_and_return:
+                        done.set()
+
+            # On free-threaded builds (see `prism.constants.GIL_DISABLED`), tasks run
+            # truly in parallel. Otherwise, the GIL serializes pure-Python code, and
+            # threads only help tasks that block on I/O or call into libraries that
+            # release the GIL. Tasks share live hooks and the task manager, so a
+            # process pool is not an option either way.
+            executor = ThreadPoolExecutor(max_workers=self.threads)
+            try:
+                with lock:
+                    for name in tasks_by_name.keys():
+                        if len(pending_refs[name]) == 0:
+                            self._inflight += 1
+                            submit(executor, name, name, 1)
+                    if self._inflight == 0:
+                        done.set()
+                done.wait()
+
+            # If we stopped waiting early (e.g., because of a KeyboardInterrupt), then
+            # don't submit any other tasks and cancel the ones that haven't started.
+            finally:
+                if not done.is_set():
+                    with lock:
+                        self._wait_and_return = True
+                    self._cancel_connections(executor, futures, timers)
+            self.compiled_tasks.clear()
+
+            # If error was found, then cancel the remaining tasks
             if self._wait_and_return:
-                self._cancel_connections(pool)
+                self._cancel_connections(executor, futures, timers)
+                if self._exec_exception is not None:
+                    raise self._exec_exception
+
                 # We need the error event and event list to cascade up to the
                 # PrismPipeline class.
-                return ExecutorOutput(0, self.error_event, self.event_list)
+                return ExecutorOutput(0, self.error_event, self._drain_event_chunks())
 
-            # Otherwise, pool should close automatically
+            # Otherwise, all tasks have finished
             else:
+                executor.shutdown(wait=True)
+
                 # We need the error event and event list to cascade up to the
                 # PrismPipeline class.
-                return ExecutorOutput(1, self.error_event, self.event_list)
+                return ExecutorOutput(1, self.error_event, self._drain_event_chunks())
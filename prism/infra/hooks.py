@@ -12,7 +12,7 @@ Table of Contents
 
 # Standard library imports
 import pandas as pd
-from typing import Any, Optional
+from typing import Any, Optional, Set
 
 # Prism-specific imports
 from prism.infra import project as prism_project
@@ -31,9 +31,22 @@ class PrismHooks:
     the user.
     """
 
+    # Hooks that block on I/O or call into libraries that release the GIL. Tasks that
+    # use these hooks can run in parallel when the project uses multiple threads.
+    HOOKS_RELEASING_GIL = frozenset({
+        "get_connection",
+        "get_cursor",
+        "sql",
+        "dbt_ref",
+    })
+
     def __init__(self, project: prism_project.PrismProject):
         self.project = project
 
+        # The SparkSession for a PySpark adapter is added under the adapter's alias,
+        # so the pipeline adds that alias here.
+        self.hooks_releasing_gil: Set[str] = set(self.HOOKS_RELEASING_GIL)
+
     def get_connection(self, adapter_name: str):
         """
         For SQL adapters, get the database connection:
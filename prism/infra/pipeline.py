@@ -81,6 +81,7 @@ class PrismPipeline:
                     pyspark_alias = aobj.get_alias()
                     pyspark_spark_session = aobj.engine
                     setattr(hooks_obj, pyspark_alias, pyspark_spark_session)
+                    hooks_obj.hooks_releasing_gil.add(pyspark_alias)
 
         self.run_context[INTERNAL_TASK_MANAGER_VARNAME] = task_manager_obj
         self.run_context[INTERNAL_HOOKS_VARNAME] = hooks_obj
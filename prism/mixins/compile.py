@@ -12,16 +12,18 @@ Table of Contents
 ###########
 
 # Standard library imports
+import os
 import re
 import argparse
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Prism-specific imports
 import prism.cli.base
 import prism.exceptions
 import prism.constants
 from prism.infra import compiler
+from prism.infra.manifest import Manifest
 from prism.infra.project import PrismProject
 from prism.parsers.ast_parser import AstParser
 
@@ -35,6 +37,36 @@ class CompileMixin():
     Mixin for compile task
     """
 
+    # Python modules found in each tasks directory. Keys are the tasks directory, and
+    # values are the modification times of all walked directories along with the
+    # modules. Adding, removing, or renaming a module changes the modification time of
+    # its parent directory, so the cached modules are valid as long as none of the
+    # modification times have changed.
+    _modules_cache: Dict[str, Tuple[Dict[str, int], List[Path]]] = {}
+    _modules_cache_maxsize = 8
+
+    # Compiled DAGs. Keys are the arguments to `compile_dag` along with a fingerprint of
+    # the task modules and prism_project.py, and values are the compiled DAGs along
+    # with their manifests.
+    _dag_cache: Dict[Tuple[Any, ...], Tuple[compiler.CompiledDag, Manifest]] = {}
+    _dag_cache_maxsize = 8
+
+    @classmethod
+    def compile_cache_clear(cls):
+        """
+        Clear all compile caches, i.e., the cached Python modules for all tasks
+        directories and the cached compiled DAGs
+        """
+        cls._modules_cache.clear()
+        cls._dag_cache.clear()
+
+    @classmethod
+    def clear_dag_cache(cls):
+        """
+        Clear the cached compiled DAGs
+        """
+        cls._dag_cache.clear()
+
     def is_valid_script_name(self,
         script: str
     ) -> bool:
@@ -90,7 +122,8 @@ class CompileMixin():
         prefix: Path = Path('')
     ) -> List[Path]:
         """
-        Get all Python modules from `tasks_dir`
+        Get all Python modules from `tasks_dir`. Modules found in the top-level tasks
+        directory are cached until one of the walked directories is modified.
 
         args:
             tasks_dir: tasks directory
@@ -98,43 +131,89 @@ class CompileMixin():
         returns:
             list of tasks in directory (as pathlib Path objects)
         """
-        modules = []
-        for path in tasks_dir.iterdir():
+        if str(prefix) != '.':
+            return self._walk_modules(tasks_dir, prefix, {})
+
+        # Check the cache
+        key = str(tasks_dir)
+        cached = self._modules_cache.get(key, None)
+        if cached is not None:
+            dir_mtimes, modules = cached
+            try:
+                if all(
+                    os.stat(_d).st_mtime_ns == _m for _d, _m in dir_mtimes.items()
+                ):
+                    return list(modules)
+            except OSError:
+                pass
+
+        # Walk the tasks directory and update the cache
+        dir_mtimes = {}
+        modules = self._walk_modules(tasks_dir, prefix, dir_mtimes)
+        self._modules_cache.pop(key, None)
+        if len(self._modules_cache) >= self._modules_cache_maxsize:
+            self._modules_cache.pop(next(iter(self._modules_cache)))
+        self._modules_cache[key] = (dir_mtimes, modules)
+        return list(modules)
+
+    def _walk_modules(self,
+        tasks_dir: Path,
+        prefix: Path,
+        dir_mtimes: Dict[str, int]
+    ) -> List[Path]:
+        """
+        Recursively get all Python modules from `tasks_dir`
 
-            # If object is a directory...
-            if path.is_dir():
+        args:
+            tasks_dir: tasks directory
+            prefix: prefix to use for directories in tasks directory
+            dir_mtimes: modification times of walked directories; updated in place
+        returns:
+            list of tasks in directory (as pathlib Path objects)
+        """
+        dir_mtimes[str(tasks_dir)] = os.stat(tasks_dir).st_mtime_ns
+        modules = []
 
-                # If parent directory is the tasks folder, set the prefix to the name
-                # of the directory. For example, if the tasks folder has a directory
-                # called "extraction", then the tasks within "extraction" should be
-                # stored as "extraction/..."
-                if str(prefix) == '.':
-                    modules.extend(self.get_modules(path, prefix=Path(path.name)))
+        # Use `os.scandir` rather than `Path.iterdir`. The directory entries cache the
+        # file type returned by the operating system, so checking whether an entry is
+        # a directory or a file doesn't require an additional `stat` call.
+        with os.scandir(tasks_dir) as entries:
+            for entry in entries:
 
-                # If parent directory is not the tasks folder, set the prefix to the
-                # parent prefix + the name of the directory. Using the above example, if
-                # the "extraction" folder has a directory called "step1", then the
-                # tasks within "step1" should be stored as "extraction/step1/..."
-                else:
-                    modules.extend(
-                        self.get_modules(path, prefix=Path(prefix) / path.name)
-                    )
+                # If object is a directory...
+                if entry.is_dir():
 
-            # If object is a file
-            elif path.is_file():
+                    # If parent directory is the tasks folder, set the prefix to the
+                    # name of the directory. For example, if the tasks folder has a
+                    # directory called "extraction", then the tasks within "extraction"
+                    # should be stored as "extraction/..."
+                    if str(prefix) == '.':
+                        modules.extend(self._walk_modules(
+                            Path(entry.path), Path(entry.name), dir_mtimes
+                        ))
+
+                    # If parent directory is not the tasks folder, set the prefix to the
+                    # parent prefix + the name of the directory. Using the above
+                    # example, if the "extraction" folder has a directory called
+                    # "step1", then the tasks within "step1" should be stored as
+                    # "extraction/step1/..."
+                    else:
+                        modules.extend(self._walk_modules(
+                            Path(entry.path), Path(prefix) / entry.name, dir_mtimes
+                        ))
 
-                # If file is a python file...
-                if len(re.findall(r'\.py$', path.name)) > 0:
+                # If object is a python file...
+                elif entry.is_file() and entry.name.endswith('.py'):
 
                     # If parent directory is the tasks folder, then just add the
                     # python file name
                     if str(prefix) == '.':
-                        modules += [Path(path.name)]
+                        modules += [Path(entry.name)]
 
                     # If parent directory is not the tasks folder, then add prefix to
                     # python file name
                     else:
-                        modules += [Path(prefix) / Path(path.name)]
+                        modules += [Path(prefix) / Path(entry.name)]
 
         return modules
 
@@ -282,10 +361,10 @@ class CompileMixin():
             None
         """
 
-        # Create compiled directory
+        # Create compiled directory. `exist_ok` handles the case where the directory
+        # already exists, so we don't need to check for it first.
         compiled_tasks_path = self.get_compiled_dir(project_dir)
-        if not compiled_tasks_path.is_dir():
-            compiled_tasks_path.mkdir(parents=True, exist_ok=True)
+        compiled_tasks_path.mkdir(parents=True, exist_ok=True)
         return compiled_tasks_path
 
     def compile_dag(self,
@@ -315,6 +394,24 @@ class CompileMixin():
         # All tasks
         all_tasks = self.get_task_names(all_parsed_tasks)
 
+        # Check the cache. The DAG only depends on the task modules and
+        # prism_project.py, so a cached DAG can be reused. The manifest on disk may
+        # have been written by a different compilation since, so rewrite it.
+        key = self._dag_cache_key(
+            project_dir,
+            tasks_dir,
+            compiled_dir,
+            all_parsed_tasks,
+            user_arg_tasks,
+            user_arg_all_downstream,
+            project
+        )
+        if key is not None and key in self._dag_cache:
+            cached_dag, cached_manifest = self._dag_cache[key]
+            cached_manifest.json_dump(compiled_dir)
+            os.chdir(project_dir)
+            return cached_dag
+
         dag_compiler = compiler.DagCompiler(
             project_dir,
             tasks_dir,
@@ -334,5 +431,51 @@ class CompileMixin():
                     message=f'task `{m}` not found in project'
                 )
 
-        # Otherwise, return
+        # Otherwise, update the cache and return
+        if key is not None:
+            self._dag_cache.pop(key, None)
+            if len(self._dag_cache) >= self._dag_cache_maxsize:
+                self._dag_cache.pop(next(iter(self._dag_cache)))
+            self._dag_cache[key] = (compiled_dag, dag_compiler.manifest)
         return compiled_dag
+
+    def _dag_cache_key(self,
+        project_dir: Path,
+        tasks_dir: Path,
+        compiled_dir: Path,
+        all_parsed_tasks: List[AstParser],
+        user_arg_tasks: List[str],
+        user_arg_all_downstream: bool,
+        project: Optional[PrismProject]
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Get the key for the compiled DAG cache. The key uses the contents of each task
+        module, which the parsers have already read, and the contents of
+        prism_project.py.
+
+        args:
+            see `compile_dag`
+        returns:
+            cache key, or None if prism_project.py could not be found
+        """
+        tasks_fingerprint = tuple(sorted(
+            (str(_p.task_relative_path), hash(_p.task_str)) for _p in all_parsed_tasks
+        ))
+        if project is not None:
+            project_fingerprint = hash(project.prism_project_py_str)
+        else:
+            try:
+                project_fingerprint = os.stat(
+                    project_dir / 'prism_project.py'
+                ).st_mtime_ns
+            except OSError:
+                return None
+        return (
+            str(project_dir),
+            str(tasks_dir),
+            str(compiled_dir),
+            tuple(sorted(user_arg_tasks)),
+            user_arg_all_downstream,
+            tasks_fingerprint,
+            project_fingerprint,
+        )
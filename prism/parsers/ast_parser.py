@@ -53,7 +53,6 @@ class AstParser:
         self.task_path = Path(self.parent_path / self.task_relative_path)
         with open(self.task_path, 'r') as f:
             self.task_str = f.read()
-        f.close()
         self.ast_module = ast.parse(self.task_str)
 
         # Check existence of if-name-main
@@ -395,7 +394,7 @@ class AstParser:
             )
 
         # Otherwise, return
-        return f'{str(self.task_relative_path).replace(".py", "")}.{ref_task_arg}'
+        return f'{str(self.task_relative_path.with_suffix(""))}.{ref_task_arg}'
 
     def get_prism_mod_calls(self,
         task_name: str,
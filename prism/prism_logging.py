@@ -20,6 +20,10 @@ import os
 import copy
 import math
 import logging
+import logging.handlers
+import queue
+import threading
+import atexit
 import time
 from typing import List, Union
 from dataclasses import dataclass
@@ -207,6 +211,35 @@ class FileHandlerFormatter(FormatterWithAnsi):
         return escape_ansi(super().format(record))
 
 
+class OverflowQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that never blocks the caller. If the queue is full, then the record
+    is emitted synchronously using the listener's handlers.
+    """
+
+    def __init__(self,
+        log_queue: 'queue.Queue[logging.LogRecord]',
+        *handlers: logging.Handler
+    ):
+        super().__init__(log_queue)
+        self.handlers = handlers
+
+        # Number of records that were emitted synchronously because the queue was full.
+        # Records are enqueued from many threads, so guard the count with a lock.
+        self.overflow_count = 0
+        self._overflow_lock = threading.Lock()
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._overflow_lock:
+                self.overflow_count += 1
+            for handler in self.handlers:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+
+
 DEFAULT_LOGGER: logging.Logger
 
 # String handler
@@ -214,6 +247,11 @@ string_streamer = StringIO()
 string_stream_handler = logging.StreamHandler(stream=string_streamer)
 string_stream_handler.setFormatter(FileHandlerFormatter())
 
+# Console events are formatted and written by a background listener, so that firing an
+# event doesn't block the calling thread (e.g., the threads executing tasks).
+LOG_QUEUE: 'queue.Queue[logging.LogRecord]' = queue.Queue(maxsize=10000)
+QUEUE_LISTENER: Optional[logging.handlers.QueueListener] = None
+
 
 def set_up_logger(args: argparse.Namespace):
     if globals().get('DEFAULT_LOGGER', None) is None:
@@ -248,10 +286,23 @@ def set_up_logger(args: argparse.Namespace):
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(FileHandlerFormatter())
 
-        # Add handlers
-        DEFAULT_LOGGER.addHandler(file_handler)
-        DEFAULT_LOGGER.addHandler(handler)
-        DEFAULT_LOGGER.addHandler(string_stream_handler)
+        # Add handlers. These are called by the queue listener.
+        global QUEUE_LISTENER
+        handlers = (file_handler, handler, string_stream_handler)
+        DEFAULT_LOGGER.addHandler(OverflowQueueHandler(LOG_QUEUE, *handlers))
+        QUEUE_LISTENER = logging.handlers.QueueListener(
+            LOG_QUEUE, *handlers, respect_handler_level=True
+        )
+        QUEUE_LISTENER.start()
+        atexit.register(QUEUE_LISTENER.stop)
+
+
+def flush_console_events():
+    """
+    Block until all console events fired so far have been emitted by the handlers
+    """
+    if QUEUE_LISTENER is not None:
+        LOG_QUEUE.join()
 
 
 #################
@@ -592,6 +643,14 @@ class ThreadsWarningEvent(Event):
         return f'{YELLOW}`THREADS` not found in prism_project.py; defaulting to 1{RESET}'  # noqa: E501
 
 
+@dataclass
+class ThreadsGilHintEvent(Event):
+    threads: int
+
+    def message(self):
+        return f'Running with {self.threads} threads, but no task uses a hook that releases the GIL; tasks that only run pure-Python code will not run in parallel'  # noqa: E501
+
+
 @dataclass
 class PyWarningEvent(Event):
     task_name: str
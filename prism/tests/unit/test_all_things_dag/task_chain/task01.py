@@ -0,0 +1,10 @@
+import time
+
+import prism.task
+
+
+class Task01(prism.task.PrismTask):
+
+    def run(self, tasks, hooks):
+        time.sleep(0.5)
+        return "This is task 01. "
@@ -0,0 +1,11 @@
+# Module list
+from pathlib import Path
+TASK_RETRIES_MODULE_LIST = [
+    Path("flaky.py"),
+    Path("downstream.py"),
+]
+
+TASK_RETRIES_TASK_LIST = [
+    "flaky.Flaky",
+    "downstream.Downstream",
+]
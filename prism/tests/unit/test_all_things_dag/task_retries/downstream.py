@@ -0,0 +1,7 @@
+import prism.task
+
+
+class Downstream(prism.task.PrismTask):
+
+    def run(self, tasks, hooks):
+        return tasks.ref('flaky') + "This is the downstream task. "
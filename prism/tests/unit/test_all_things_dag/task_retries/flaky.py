@@ -0,0 +1,14 @@
+import prism.task
+
+
+class Flaky(prism.task.PrismTask):
+    RETRIES = 2
+    RETRY_DELAY_SECONDS = 0
+
+    def run(self, tasks, hooks):
+        # Fail on the first two attempts
+        num_attempts = getattr(hooks, "flaky_attempts", 0) + 1
+        hooks.flaky_attempts = num_attempts
+        if num_attempts <= 2:
+            raise ValueError(f"This is attempt {num_attempts} of the flaky task.")
+        return "This is the flaky task. "
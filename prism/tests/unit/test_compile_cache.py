@@ -0,0 +1,271 @@
+"""
+Unit testing for the caches used by the CompileMixin
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import argparse
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import List, Optional
+from unittest import mock
+
+# Prism imports
+from prism.mixins.compile import CompileMixin
+import prism.prism_logging
+
+# Set up logger
+args = argparse.Namespace()
+args.log_level = "info"
+prism.prism_logging.set_up_logger(args)
+
+
+##################
+# Task templates #
+##################
+
+TASK_A = """import prism.task
+
+
+class A(prism.task.PrismTask):
+
+    def run(self, tasks, hooks):
+        return "This is task A."
+"""
+
+TASK_B_WITH_REF = """import prism.task
+
+
+class B(prism.task.PrismTask):
+
+    def run(self, tasks, hooks):
+        return tasks.ref('a') + " This is task B."
+"""
+
+TASK_B_NO_REF = """import prism.task
+
+
+class B(prism.task.PrismTask):
+
+    def run(self, tasks, hooks):
+        return "This is task B."
+"""
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestCompileCache(
+    unittest.TestCase,
+    CompileMixin
+):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.project_dir = Path(self.tmpdir.name)
+        self.tasks_dir = self.project_dir / 'tasks'
+        self.tasks_dir.mkdir()
+        (self.project_dir / 'prism_project.py').write_text('')
+        (self.tasks_dir / 'a.py').write_text(TASK_A)
+        (self.tasks_dir / 'b.py').write_text(TASK_B_WITH_REF)
+        self.compiled_dir = self.create_compiled_dir(self.project_dir)
+        CompileMixin._modules_cache.clear()
+        CompileMixin._dag_cache.clear()
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+        CompileMixin._modules_cache.clear()
+        CompileMixin._dag_cache.clear()
+
+    def _compile(self,
+        user_arg_tasks: Optional[List[str]] = None,
+        user_arg_all_downstream: bool = True,
+    ):
+        """
+        Parse the tasks in the temporary project and compile the DAG
+        """
+        all_parsed_tasks = self.parse_all_tasks(
+            self.get_modules(self.tasks_dir),
+            tasks_dir=self.tasks_dir
+        )
+        if user_arg_tasks is None:
+            user_arg_tasks = self.get_task_names(all_parsed_tasks)
+        return self.compile_dag(
+            self.project_dir,
+            self.tasks_dir,
+            self.compiled_dir,
+            all_parsed_tasks,
+            user_arg_tasks,
+            user_arg_all_downstream,
+            None,
+        )
+
+    def _manifest_refs(self):
+        with open(self.compiled_dir / 'manifest.json', 'r') as f:
+            manifest = json.loads(f.read())
+        return manifest["refs"]
+
+    def _wait_for_mtime(self):
+        """
+        Wait so that the next modification changes the directory's modification time
+        """
+        time.sleep(0.05)
+
+    ################
+    # Module cache #
+    ################
+
+    def test_modules_cache_hit(self):
+        """
+        Walking an unchanged tasks directory reuses the cached modules
+        """
+        modules1 = self.get_modules(self.tasks_dir)
+        with mock.patch.object(
+            self, '_walk_modules', wraps=self._walk_modules
+        ) as walk_modules:
+            modules2 = self.get_modules(self.tasks_dir)
+        walk_modules.assert_not_called()
+        self.assertEqual(modules1, modules2)
+        self.assertEqual([Path('a.py'), Path('b.py')], sorted(modules2))
+
+    def test_modules_cache_top_level(self):
+        """
+        Adding or removing a module in the top-level tasks directory invalidates the
+        cached modules
+        """
+        self.get_modules(self.tasks_dir)
+        self._wait_for_mtime()
+        (self.tasks_dir / 'c.py').write_text(TASK_A)
+        self.assertEqual(
+            [Path('a.py'), Path('b.py'), Path('c.py')],
+            sorted(self.get_modules(self.tasks_dir))
+        )
+        self._wait_for_mtime()
+        (self.tasks_dir / 'c.py').unlink()
+        self.assertEqual(
+            [Path('a.py'), Path('b.py')], sorted(self.get_modules(self.tasks_dir))
+        )
+
+    def test_modules_cache_nested(self):
+        """
+        Adding or removing a module in a nested directory invalidates the cached
+        modules
+        """
+        nested_dir = self.tasks_dir / 'extract' / 'step1'
+        nested_dir.mkdir(parents=True)
+        self.assertEqual(
+            [Path('a.py'), Path('b.py')], sorted(self.get_modules(self.tasks_dir))
+        )
+        self._wait_for_mtime()
+        (nested_dir / 'c.py').write_text(TASK_A)
+        self.assertEqual(
+            [Path('a.py'), Path('b.py'), Path('extract/step1/c.py')],
+            sorted(self.get_modules(self.tasks_dir))
+        )
+        self._wait_for_mtime()
+        (nested_dir / 'c.py').unlink()
+        self.assertEqual(
+            [Path('a.py'), Path('b.py')], sorted(self.get_modules(self.tasks_dir))
+        )
+
+    def test_compile_cache_clear(self):
+        """
+        `compile_cache_clear` clears both the cached modules and the cached DAGs
+        """
+        self._compile()
+        self.assertEqual(1, len(self._modules_cache))
+        self.assertEqual(1, len(self._dag_cache))
+        self.compile_cache_clear()
+        self.assertEqual(0, len(self._modules_cache))
+        self.assertEqual(0, len(self._dag_cache))
+
+    #############
+    # DAG cache #
+    #############
+
+    def test_dag_cache_hit(self):
+        """
+        Compiling twice with identical inputs returns the cached DAG
+        """
+        dag1 = self._compile()
+        dag2 = self._compile()
+        self.assertIs(dag1, dag2)
+        self.assertEqual(1, len(self._dag_cache))
+
+    def test_dag_cache_miss_task_source(self):
+        """
+        Changing a task's source invalidates the cached DAG
+        """
+        dag1 = self._compile()
+        (self.tasks_dir / 'b.py').write_text(TASK_B_NO_REF)
+        dag2 = self._compile()
+        self.assertIsNot(dag1, dag2)
+        self.assertEqual([('a.A', 'b.B')], list(dag1.nxdag.edges))
+        self.assertEqual([], list(dag2.nxdag.edges))
+
+    def test_dag_cache_miss_user_args(self):
+        """
+        Changing `user_arg_tasks` or `user_arg_all_downstream` invalidates the cached
+        DAG
+        """
+        dag1 = self._compile(['a.A'], True)
+        dag2 = self._compile(['b.B'], True)
+        dag3 = self._compile(['b.B'], False)
+        self.assertIsNot(dag1, dag2)
+        self.assertIsNot(dag2, dag3)
+        self.assertIsNot(dag1, dag3)
+        self.assertEqual(3, len(self._dag_cache))
+
+    def test_dag_cache_eviction(self):
+        """
+        The oldest cached DAG is evicted once the cache reaches its maximum size
+        """
+        with mock.patch.object(CompileMixin, '_dag_cache_maxsize', 2):
+            dag1 = self._compile(['a.A'])
+            self._compile(['b.B'])
+            self._compile(['a.A', 'b.B'])
+            self.assertEqual(2, len(self._dag_cache))
+            self.assertIsNot(dag1, self._compile(['a.A']))
+
+    def test_clear_dag_cache(self):
+        """
+        `clear_dag_cache` removes all cached DAGs
+        """
+        dag1 = self._compile()
+        self.clear_dag_cache()
+        self.assertEqual(0, len(self._dag_cache))
+        self.assertIsNot(dag1, self._compile())
+
+    def test_dag_cache_hit_rewrites_manifest(self):
+        """
+        A cache hit rewrites the manifest, which may have been overwritten by a
+        compilation of a different DAG
+        """
+        dag1 = self._compile()
+        self.assertEqual({'a': {'A': []}, 'b': {'B': ['a.A']}}, self._manifest_refs())
+
+        # Drop the ref
+        (self.tasks_dir / 'b.py').write_text(TASK_B_NO_REF)
+        self._compile()
+        self.assertEqual({'a': {'A': []}, 'b': {'B': []}}, self._manifest_refs())
+
+        # Revert
+        (self.tasks_dir / 'b.py').write_text(TASK_B_WITH_REF)
+        dag3 = self._compile()
+        self.assertIs(dag1, dag3)
+        self.assertEqual({'a': {'A': []}, 'b': {'B': ['a.A']}}, self._manifest_refs())
+
+
+if __name__ == "__main__":
+    unittest.main()
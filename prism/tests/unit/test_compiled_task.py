@@ -0,0 +1,76 @@
+"""
+Unit testing for the CompiledTask class
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import unittest
+from pathlib import Path
+from typing import Any
+
+# Prism imports
+import prism.exceptions
+from prism.infra.compiled_task import CompiledTask
+from prism.infra.manifest import TaskManifest
+from prism.parsers.ast_parser import AstParser
+from prism.tests.unit.test_all_things_dag import DAG_TEST_CASES
+
+
+###########################
+# Paths / class instances #
+###########################
+
+# Task directories
+TASK_REF_3NODES_DIR = Path(DAG_TEST_CASES) / 'task_ref_3nodes'
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestCompiledTask(unittest.TestCase):
+
+    def _create_compiled_task(self, refs: Any) -> CompiledTask:
+        """
+        Create a CompiledTask for `task02.Task02` whose manifest has refs `refs`
+        """
+        relative_path = Path('task02.py')
+        task_manifest = TaskManifest()
+        task_manifest.add_refs(relative_path, 'Task02', refs)
+        return CompiledTask(
+            'Task02',
+            relative_path,
+            TASK_REF_3NODES_DIR / relative_path,
+            task_manifest,
+            AstParser(relative_path, TASK_REF_3NODES_DIR),
+        )
+
+    def test_refs_list(self):
+        """
+        Refs that are already a list are kept as-is
+        """
+        compiled_task = self._create_compiled_task(['task01.Task01'])
+        self.assertEqual(['task01.Task01'], compiled_task.refs)
+
+    def test_refs_single_str(self):
+        """
+        A single ref stored as a string is normalized to a list
+        """
+        compiled_task = self._create_compiled_task('task01.Task01')
+        self.assertEqual(['task01.Task01'], compiled_task.refs)
+
+    def test_refs_invalid_type(self):
+        """
+        Refs that are neither a string nor a list raise a CompileException when the
+        task is compiled
+        """
+        with self.assertRaises(prism.exceptions.CompileException):
+            self._create_compiled_task({'task01.Task01': None})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,344 @@
+"""
+Unit testing for the DagExecutor class
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import argparse
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import List, Optional
+from unittest import mock
+
+# Prism imports
+from prism.mixins.compile import CompileMixin
+from prism.infra import compiler
+from prism.infra.executor import DagExecutor
+from prism.infra.hooks import PrismHooks
+from prism.infra.task_manager import PrismTaskManager
+import prism.prism_logging
+from prism.constants import (
+    GIL_DISABLED,
+    INTERNAL_TASK_MANAGER_VARNAME,
+    INTERNAL_HOOKS_VARNAME,
+)
+from prism.tests.unit.test_all_things_dag import DAG_TEST_CASES
+from prism.tests.unit.test_all_things_dag.task_ref_15nodes import (
+    TASK_REF_15NODES_MODULE_LIST,
+    TASK_REF_15NODES_TASK_LIST,
+)
+from prism.tests.unit.test_all_things_dag.task_chain import (
+    TASK_CHAIN_MODULE_LIST,
+    TASK_CHAIN_TASK_LIST,
+)
+from prism.tests.unit.test_all_things_dag.task_retries import (
+    TASK_RETRIES_MODULE_LIST,
+    TASK_RETRIES_TASK_LIST,
+)
+
+# Set up logger
+args = argparse.Namespace()
+args.log_level = "info"
+prism.prism_logging.set_up_logger(args)
+
+
+###########################
+# Paths / class instances #
+###########################
+
+# Task directories
+TASK_REF_15NODES_DIR = Path(DAG_TEST_CASES) / 'task_ref_15nodes'
+TASK_RETRIES_DIR = Path(DAG_TEST_CASES) / 'task_retries'
+TASK_CHAIN_DIR = Path(DAG_TEST_CASES) / 'task_chain'
+
+
+class InterruptedEvent(threading.Event):
+    """
+    Event whose `wait` raises a KeyboardInterrupt when called from `DagExecutor.exec`,
+    as if the user pressed Ctrl-C while the DAG was running
+    """
+
+    def wait(self, timeout=None):
+        if sys._getframe(1).f_code.co_name == "exec":
+            raise KeyboardInterrupt
+        return super().wait(timeout)
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestDagExecutor(
+    unittest.TestCase,
+    CompileMixin
+):
+
+    def _create_executor(self,
+        threads: int,
+        user_arg_tasks: Optional[List[str]] = None,
+        user_arg_all_upstream: bool = False,
+        module_list: List[Path] = TASK_REF_15NODES_MODULE_LIST,
+        tasks_dir: Path = TASK_REF_15NODES_DIR,
+        task_list: List[str] = TASK_REF_15NODES_TASK_LIST,
+    ):
+        """
+        Compile the DAG (by default, the DAG with 15 nodes) and create a DagExecutor
+        for it
+        """
+        all_parsed_tasks = self.parse_all_tasks(
+            module_list,
+            tasks_dir=tasks_dir
+        )
+        if user_arg_tasks is None:
+            user_arg_tasks = task_list
+        dag_compiler = compiler.DagCompiler(
+            project_dir=DAG_TEST_CASES,
+            tasks_dir=tasks_dir,
+            compiled_dir=None,
+            all_tasks=task_list,
+            parsed_tasks=all_parsed_tasks,
+            user_arg_tasks=user_arg_tasks,
+            user_arg_all_downstream=False,
+            project=None,
+        )
+        nxdag, topsort = dag_compiler.create_topsort(
+            task_list,
+            user_arg_tasks,
+            all_parsed_tasks,
+        )
+        compiled_dag = compiler.CompiledDag(
+            tasks_dir,
+            nxdag,
+            topsort,
+            user_arg_tasks,
+            dag_compiler.task_manifests,
+            all_parsed_tasks,
+        )
+        executor = DagExecutor(
+            DAG_TEST_CASES,
+            compiled_dag,
+            user_arg_all_upstream,
+            False,
+            threads,
+        )
+
+        # Run context
+        task_manager = PrismTaskManager(upstream={}, parsed_tasks=all_parsed_tasks)
+        run_context = {
+            INTERNAL_TASK_MANAGER_VARNAME: task_manager,
+            INTERNAL_HOOKS_VARNAME: PrismHooks(None),  # type: ignore
+        }
+        executor.set_run_context(run_context)
+        return executor, task_manager
+
+    def test_exec_single_thread(self):
+        """
+        Executing the DAG with one thread runs all tasks
+        """
+        executor, task_manager = self._create_executor(threads=1)
+        output = executor.exec(full_tb=False)
+        self.assertEqual(1, output.success)
+        self.assertIsNone(output.error_event)
+        self.assertEqual(
+            sorted(TASK_REF_15NODES_TASK_LIST), sorted(task_manager.upstream.keys())
+        )
+
+    def test_exec_multiple_threads(self):
+        """
+        Executing the DAG with multiple threads runs all tasks, and each task can access
+        the output of its refs.
+        """
+        executor, task_manager = self._create_executor(threads=4)
+        output = executor.exec(full_tb=False)
+        self.assertEqual(1, output.success)
+        self.assertIsNone(output.error_event)
+        self.assertEqual(
+            sorted(TASK_REF_15NODES_TASK_LIST), sorted(task_manager.upstream.keys())
+        )
+        self.assertEqual(
+            "This is task 01. This is task 02.This is task 01. This is task 03. This is task 04. This is task 01. This is task 05. This is task 06. This is task 07. ",  # noqa: E501
+            task_manager.upstream["task07.Task07a"].get_output()
+        )
+
+    def test_exec_run_context(self):
+        """
+        Each task gets its own `__file__`, and task instances are accessible via the
+        shared run context after execution.
+        """
+        executor, _ = self._create_executor(threads=4)
+        output = executor.exec(full_tb=False)
+        self.assertEqual(1, output.success)
+        self.assertNotIn("__file__", executor.run_context)
+        for task in TASK_REF_15NODES_TASK_LIST:
+            self.assertIn(task, executor.run_context)
+
+    def test_task_code_compiled_once(self):
+        """
+        Tasks are compiled the first time they are executed, and the code object is
+        reused on subsequent executions.
+        """
+        executor, _ = self._create_executor(threads=1)
+        compiled_tasks = executor.compiled_dag.compiled_tasks
+        executor.exec(full_tb=False)
+        code_objects = [_t._code for _t in compiled_tasks]
+        for code in code_objects:
+            self.assertIsNotNone(code)
+
+        # Execute the same DAG again
+        compiled_dag = executor.compiled_dag
+        executor = DagExecutor(DAG_TEST_CASES, compiled_dag, False, False, 1)
+        task_manager = PrismTaskManager(
+            upstream={}, parsed_tasks=compiled_dag.parsed_tasks
+        )
+        executor.set_run_context({
+            INTERNAL_TASK_MANAGER_VARNAME: task_manager,
+            INTERNAL_HOOKS_VARNAME: PrismHooks(None),  # type: ignore
+        })
+        output = executor.exec(full_tb=False)
+        self.assertEqual(1, output.success)
+        for task, code in zip(compiled_tasks, code_objects):
+            self.assertIs(code, task._code)
+
+    def test_user_context_not_shared(self):
+        """
+        Executors created without a user context do not share one
+        """
+        executor1, _ = self._create_executor(threads=1)
+        executor2, _ = self._create_executor(threads=1)
+        self.assertEqual({}, executor1.user_context)
+        self.assertIsNot(executor1.user_context, executor2.user_context)
+
+    @unittest.skipIf(GIL_DISABLED, "the GIL is disabled")
+    def test_exec_multiple_threads_gil_hint(self):
+        """
+        Executing a DAG that doesn't use any GIL-releasing hooks with multiple threads
+        logs, at the debug level, that the threads may not help. The hint is not part
+        of the returned events.
+        """
+        hint = "no task uses a hook that releases the GIL"
+        executor, _ = self._create_executor(threads=4)
+        self.assertFalse(executor._tasks_release_gil())
+        with self.assertLogs("PRISM_LOGGER", level="DEBUG") as cm:
+            output = executor.exec(full_tb=False)
+        self.assertEqual(1, output.success)
+        self.assertTrue(any(
+            _r.levelname == "DEBUG" and hint in _r.getMessage() for _r in cm.records
+        ))
+        self.assertNotIn(
+            "ThreadsGilHintEvent", [str(_e) for _e in output.event_list]
+        )
+
+        # No hint when running with a single thread
+        executor, _ = self._create_executor(threads=1)
+        with self.assertLogs("PRISM_LOGGER", level="DEBUG") as cm:
+            executor.exec(full_tb=False)
+        self.assertFalse(any(hint in _r.getMessage() for _r in cm.records))
+
+    def test_tasks_release_gil_hook_alias(self):
+        """
+        Hooks added to `hooks_releasing_gil` (e.g., the alias of a PySpark adapter)
+        count as releasing the GIL
+        """
+        executor, _ = self._create_executor(
+            threads=4,
+            module_list=TASK_RETRIES_MODULE_LIST,
+            tasks_dir=TASK_RETRIES_DIR,
+            task_list=TASK_RETRIES_TASK_LIST,
+        )
+        self.assertFalse(executor._tasks_release_gil())
+        executor.run_context[INTERNAL_HOOKS_VARNAME].hooks_releasing_gil.add(
+            "flaky_attempts"
+        )
+        self.assertTrue(executor._tasks_release_gil())
+
+    def test_exec_multiple_threads_interrupted(self):
+        """
+        Interrupting a multi-threaded run lets the running task finish but doesn't run
+        any of its downstream tasks
+        """
+        executor, task_manager = self._create_executor(
+            threads=2,
+            module_list=TASK_CHAIN_MODULE_LIST,
+            tasks_dir=TASK_CHAIN_DIR,
+            task_list=TASK_CHAIN_TASK_LIST,
+        )
+        with mock.patch.object(threading, "Event", InterruptedEvent):
+            with self.assertRaises(KeyboardInterrupt):
+                executor.exec(full_tb=False)
+
+        # Give any tasks still running in the background time to finish
+        time.sleep(1)
+        self.assertEqual(["task01.Task01"], list(task_manager.upstream.keys()))
+
+    def test_exec_multiple_threads_subset(self):
+        """
+        Executing a subset of the DAG with multiple threads only runs the selected
+        tasks and their upstream dependencies.
+        """
+        executor, task_manager = self._create_executor(
+            threads=4,
+            user_arg_tasks=["task09.Task09"],
+            user_arg_all_upstream=True,
+        )
+        output = executor.exec(full_tb=False)
+        self.assertEqual(1, output.success)
+        self.assertEqual(
+            sorted([
+                "task01.Task01",
+                "task05.Task05",
+                "task08.Task08",
+                "task09.Task09",
+            ]),
+            sorted(task_manager.upstream.keys())
+        )
+
+    def _check_retries(self, threads: int):
+        """
+        A failed task is retried, and its downstream tasks run once the retry succeeds
+        """
+        executor, task_manager = self._create_executor(
+            threads=threads,
+            module_list=TASK_RETRIES_MODULE_LIST,
+            tasks_dir=TASK_RETRIES_DIR,
+            task_list=TASK_RETRIES_TASK_LIST,
+        )
+        output = executor.exec(full_tb=False)
+        self.assertEqual(1, output.success)
+        self.assertIsNone(output.error_event)
+        self.assertEqual(
+            "This is the flaky task. This is the downstream task. ",
+            task_manager.upstream["downstream.Downstream"].get_output()
+        )
+
+        # The retry should be announced and have its own execution events
+        event_names = [
+            f"{str(e)} - {e.msg}" if hasattr(e, "msg") else str(e)
+            for e in output.event_list
+        ]
+        self.assertEqual(2, event_names.count("DelayEvent"))
+        for num_retry in [1, 2]:
+            self.assertTrue(any(
+                f"'flaky.Flaky (RETRY {num_retry})'" in _e for _e in event_names
+            ))
+
+        # Retry names shouldn't accumulate
+        self.assertFalse(any("(RETRY 1) (RETRY 2)" in _e for _e in event_names))
+
+    def test_exec_single_thread_retries(self):
+        """
+        Retries work when executing the DAG with one thread
+        """
+        self._check_retries(threads=1)
+
+    def test_exec_multiple_threads_retries(self):
+        """
+        Retries work when executing the DAG with multiple threads
+        """
+        self._check_retries(threads=2)
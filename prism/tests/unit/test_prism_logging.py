@@ -0,0 +1,104 @@
+"""
+Unit testing for the console event logging
+"""
+
+
+###########
+# Imports #
+###########
+
+# Standard library imports
+import argparse
+import logging
+import queue
+import threading
+import unittest
+from io import StringIO
+from unittest import mock
+
+# Prism imports
+import prism.prism_logging
+from prism.prism_logging import OverflowQueueHandler
+
+# Set up logger
+args = argparse.Namespace()
+args.log_level = "info"
+prism.prism_logging.set_up_logger(args)
+
+
+##############################
+# Test case class definition #
+##############################
+
+class TestPrismLogging(unittest.TestCase):
+
+    def _make_record(self, msg: str) -> logging.LogRecord:
+        return logging.LogRecord(
+            "PRISM_LOGGER", logging.INFO, __file__, 0, msg, None, None
+        )
+
+    def test_flush_console_events(self):
+        """
+        Console events reach the string stream handler once they are flushed
+        """
+        event = prism.prism_logging.ThreadsWarningEvent()
+        prism.prism_logging.fire_console_event(event, [], 0)
+        prism.prism_logging.flush_console_events()
+        self.assertIn(
+            "`THREADS` not found in prism_project.py",
+            prism.prism_logging.string_streamer.getvalue()
+        )
+
+    def test_overflow_emits_synchronously(self):
+        """
+        If the queue is full, then records are emitted synchronously and counted
+        """
+        stream = StringIO()
+        handler = logging.StreamHandler(stream=stream)
+        log_queue: 'queue.Queue[logging.LogRecord]' = queue.Queue(maxsize=1)
+        queue_handler = OverflowQueueHandler(log_queue, handler)
+
+        # The first record fills the queue
+        queue_handler.enqueue(self._make_record("queued"))
+        self.assertEqual(0, queue_handler.overflow_count)
+        self.assertEqual("", stream.getvalue())
+
+        # The second record overflows
+        queue_handler.enqueue(self._make_record("overflow"))
+        self.assertEqual(1, queue_handler.overflow_count)
+        self.assertEqual("overflow\n", stream.getvalue())
+
+    def test_overflow_count_threads(self):
+        """
+        Records that overflow from multiple threads are all counted
+        """
+        log_queue: 'queue.Queue[logging.LogRecord]' = queue.Queue(maxsize=1)
+        queue_handler = OverflowQueueHandler(log_queue)
+        queue_handler.enqueue(self._make_record("queued"))
+
+        def _enqueue():
+            for _ in range(1000):
+                queue_handler.enqueue(self._make_record("overflow"))
+
+        threads = [threading.Thread(target=_enqueue) for _ in range(8)]
+        for _t in threads:
+            _t.start()
+        for _t in threads:
+            _t.join()
+        self.assertEqual(8000, queue_handler.overflow_count)
+
+    def test_flush_console_events_no_listener(self):
+        """
+        Flushing console events before the logger is set up is a no-op
+        """
+        log_queue: 'queue.Queue[logging.LogRecord]' = queue.Queue()
+        log_queue.put(self._make_record("unprocessed"))
+        with mock.patch.object(prism.prism_logging, "QUEUE_LISTENER", None), \
+                mock.patch.object(prism.prism_logging, "LOG_QUEUE", log_queue):
+            # This would block forever if the queue were joined
+            prism.prism_logging.flush_console_events()
+        self.assertEqual(1, log_queue.qsize())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,38 +2,79 @@
 UI for logging events
 
 Table of Contents
+- Imports
+- Color support
 - ANSI color codes
 """
 
+###########
+# Imports #
+###########
+
+import os
+import sys
+
+
+#################
+# Color support #
+#################
+
+def _supports_color() -> bool:
+    """
+    Whether to emit ANSI color codes. Colors are disabled when the NO_COLOR environment
+    variable is set (see https://no-color.org) or when console events aren't written to
+    a terminal (e.g., when output is redirected to a file or collected in CI).
+
+    returns:
+        True if colors should be emitted
+    """
+    if "NO_COLOR" in os.environ:
+        return False
+    try:
+        return sys.stderr.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+SUPPORTS_COLOR = _supports_color()
+
+
+def _c(code: str) -> str:
+    """
+    Return `code` if colors are supported, otherwise an empty string
+    """
+    return code if SUPPORTS_COLOR else ""
+
+
 ####################
 # ANSI color codes #
 ####################
 
-BLACK = "\u001b[30m"
-RED = "\u001b[31m"
-GREEN = "\u001b[32m"
-YELLOW = "\u001b[33m"
-BLUE = "\u001b[38;5;69m"
-PURPLE = "\u001b[38;5;99m"
-MAGENTA = "\u001b[38;5;170m"
-CYAN = "\u001b[36m"
-WHITE = "\u001b[37m"
-RESET = "\u001b[0m"
-BRIGHT_WHITE = "\u001b[37;1m"
-BRIGHT_YELLOW = "\u001b[33;1m"
-BRIGHT_GREEN = "\u001b[32;1m"
-BOLD = "\u001b[1m"
-HEADER_GRAY = "\u001b[0m"
-GRAY_PINK = "\u001b[38;5;96m"
-ORANGE_BROWN = "\u001b[38;5;180m"
+BLACK = _c("\u001b[30m")
+RED = _c("\u001b[31m")
+GREEN = _c("\u001b[32m")
+YELLOW = _c("\u001b[33m")
+BLUE = _c("\u001b[38;5;69m")
+PURPLE = _c("\u001b[38;5;99m")
+MAGENTA = _c("\u001b[38;5;170m")
+CYAN = _c("\u001b[36m")
+WHITE = _c("\u001b[37m")
+RESET = _c("\u001b[0m")
+BRIGHT_WHITE = _c("\u001b[37;1m")
+BRIGHT_YELLOW = _c("\u001b[33;1m")
+BRIGHT_GREEN = _c("\u001b[32;1m")
+BOLD = _c("\u001b[1m")
+HEADER_GRAY = _c("\u001b[0m")
+GRAY_PINK = _c("\u001b[38;5;96m")
+ORANGE_BROWN = _c("\u001b[38;5;180m")
 
 # Event colors
-EVENT_COLOR = "\u001b[38;5;103m"
+EVENT_COLOR = _c("\u001b[38;5;103m")
 
 # Agent colors
-AGENT_EVENT = "\u001b[38;5;32m"
-AGENT_WHICH_BUILD = "\u001b[38;5;178m"
-AGENT_WHICH_RUN = "\u001b[38;5;10m"
+AGENT_EVENT = _c("\u001b[38;5;32m")
+AGENT_WHICH_BUILD = _c("\u001b[38;5;178m")
+AGENT_WHICH_RUN = _c("\u001b[38;5;10m")
 
 
 ##################